@@ -15,6 +15,11 @@
 import json
 from typing import Dict, Any, Optional, List, Union
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra; falls back to the stdlib json module
+    orjson = None
+
 # Import the MCP SDK
 from mcp.server.fastmcp import FastMCP, Context
 
@@ -30,7 +35,7 @@
 from src.config import load_config, save_config, TransportType, Config
 from src.context import AgentAPIContext, agent_api_lifespan
 from src.api_client import AgentAPIClient
-from src.models import AgentType, MessageType
+from src.models import MessageType, convert_to_agent_type
 from src.utils.error_handler import create_error_response, handle_exception
 
 # Configure logging
@@ -40,6 +45,17 @@
 )
 logger = logging.getLogger("mcp-agentapi")
 
+# Lookup table for validating message types without raising ValueError
+_MESSAGE_TYPE_LOOKUP = {message_type.value: message_type for message_type in MessageType}
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
 # Create the MCP server with proper lifespan management
 mcp = FastMCP(
     "AgentAPI-MCP",
@@ -47,8 +63,255 @@
     lifespan=agent_api_lifespan,
 )
 
-# Import the rest of the server implementation from the original server.py file
-# This is a placeholder - you would need to copy the actual implementation here
+
+@mcp.tool()
+async def get_agent_type(ctx: Context) -> Optional[str]:
+    """
+    Get the type of the current agent.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        The agent type as a string, or None if no agent type is set
+    """
+    return ctx.request_context.lifespan_context.agent_type_name
+
+
+@mcp.tool()
+async def list_available_agents(ctx: Context, refresh: bool = False) -> List[Dict[str, str]]:
+    """
+    List all available agents and their installation status.
+
+    Detection results are reused for a short time, so repeated calls don't
+    probe the system every time. Pass refresh=True to detect agents again.
+
+    Args:
+        ctx: The MCP context
+        refresh: Whether to detect agents again instead of using a cached result
+
+    Returns:
+        List of dictionaries with "type" and "status" keys
+    """
+    app_ctx: AgentAPIContext = ctx.request_context.lifespan_context
+    agents = await app_ctx.detect_agents(force=refresh)
+
+    return [
+        {"type": agent_type.value, "status": agent_info.install_status.value}
+        for agent_type, agent_info in agents.items()
+    ]
+
+
+@mcp.tool()
+async def describe_agent_state(ctx: Context) -> Dict[str, Any]:
+    """
+    Get the available agents, the current agent type, and the health status.
+
+    This combines what clients would otherwise fetch with separate calls
+    (available agents, agent type and health) into a single tool call. Agent
+    detection and the health check run concurrently.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        Dictionary with "agents", "agent_type" and "health" keys
+    """
+    app_ctx: AgentAPIContext = ctx.request_context.lifespan_context
+    agents, health = await asyncio.gather(
+        app_ctx.detect_agents(),
+        app_ctx.health_check.check_health(),
+    )
+
+    return {
+        "agents": [
+            {"type": agent_type.value, "status": agent_info.install_status.value}
+            for agent_type, agent_info in agents.items()
+        ],
+        "agent_type": app_ctx.agent_type_name,
+        "health": health,
+    }
+
+
+@mcp.tool()
+async def get_status(ctx: Context) -> str:
+    """
+    Get the current status of the agent.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        The agent status as a string ("stable" or "running")
+    """
+    api_client: AgentAPIClient = ctx.request_context.lifespan_context.api_client
+    status = await api_client.get_status()
+    return status.get("status", "unknown")
+
+
+@mcp.tool()
+async def get_messages(ctx: Context) -> Dict[str, Any]:
+    """
+    Get all messages in the conversation history.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        Dictionary with the conversation messages
+    """
+    api_client: AgentAPIClient = ctx.request_context.lifespan_context.api_client
+    return await api_client.get_messages()
+
+
+@mcp.tool()
+async def send_message(ctx: Context, content: str, type: str = "user") -> Dict[str, Any]:
+    """
+    Send a message to the agent.
+
+    Args:
+        ctx: The MCP context
+        content: The message content
+        type: The message type (user or raw)
+
+    Returns:
+        Dictionary with the result
+    """
+    message_type = _MESSAGE_TYPE_LOOKUP.get(type)
+    if message_type is None:
+        return create_error_response(
+            f"Invalid message type: {type}",
+            error_type="ValidationError",
+            status_code=400,
+            detail=f"Valid types are: {', '.join(_MESSAGE_TYPE_LOOKUP)}"
+        )
+
+    api_client: AgentAPIClient = ctx.request_context.lifespan_context.api_client
+    return await api_client.send_message(content, message_type)
+
+
+@mcp.tool()
+async def send_messages_batch(ctx: Context, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Send several messages to the agent in a single tool call.
+
+    Each message is a dictionary with a "content" key and an optional "type"
+    key (user or raw, default user). All messages are validated before any is
+    sent, and they are sent in order over the shared connection pool.
+
+    Args:
+        ctx: The MCP context
+        messages: The messages to send
+
+    Returns:
+        Dictionary with the number of messages sent and the result of each send
+    """
+    # Validate the whole batch up front so an invalid entry can't leave it half-sent
+    batch = []
+    for index, message in enumerate(messages):
+        content = message.get("content")
+        if content is None:
+            return create_error_response(
+                f"Message {index} has no content",
+                error_type="ValidationError",
+                status_code=400
+            )
+
+        message_type = _MESSAGE_TYPE_LOOKUP.get(message.get("type", "user"))
+        if message_type is None:
+            return create_error_response(
+                f"Invalid message type for message {index}: {message.get('type')}",
+                error_type="ValidationError",
+                status_code=400,
+                detail=f"Valid types are: {', '.join(_MESSAGE_TYPE_LOOKUP)}"
+            )
+        batch.append((content, message_type))
+
+    # The Agent API has no batch endpoint, and messages (raw keystrokes in
+    # particular) must arrive in order, so they are sent one after another
+    api_client: AgentAPIClient = ctx.request_context.lifespan_context.api_client
+    results = []
+    for content, message_type in batch:
+        try:
+            results.append(await api_client.send_message(content, message_type))
+        except Exception as e:
+            error_data = handle_exception(e)
+            error_data["sent"] = len(results)
+            error_data["results"] = results
+            return error_data
+
+    return {"sent": len(results), "results": results}
+
+
+@mcp.tool()
+async def get_screen(ctx: Context) -> Dict[str, Any]:
+    """
+    Get the current screen content from the agent.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        Dictionary with the screen content
+    """
+    api_client: AgentAPIClient = ctx.request_context.lifespan_context.api_client
+    return {"screen": await api_client.get_screen()}
+
+
+@mcp.resource("agent://info", mime_type="application/json")
+async def get_agent_info() -> str:
+    """
+    Get information about the agent.
+
+    The agent type and URL are fixed for the lifetime of the context, so the
+    serialized info is cached and reused while the agent status is unchanged.
+
+    Returns:
+        JSON string with agent information
+    """
+    app_ctx: AgentAPIContext = mcp.get_context().request_context.lifespan_context
+    status = await app_ctx.api_client.get_status()
+    agent_status = status.get("status", "unknown")
+
+    cached = app_ctx.agent_info_json
+    if cached is not None and cached[0] == agent_status:
+        return cached[1]
+
+    info_json = _dumps({
+        "agent_type": app_ctx.agent_type_name,
+        "agent_api_url": app_ctx.agent_api_url,
+        "status": agent_status,
+    })
+    app_ctx.agent_info_json = (agent_status, info_json)
+    return info_json
+
+
+@mcp.resource("agent://openapi", mime_type="application/json")
+async def get_openapi_schema() -> str:
+    """
+    Get the OpenAPI schema for the Agent API.
+
+    The serialized schema is cached on the context and reused while the Agent
+    API returns the same schema. Schemas without a version are not cached.
+
+    Returns:
+        JSON string with OpenAPI schema
+    """
+    app_ctx: AgentAPIContext = mcp.get_context().request_context.lifespan_context
+    schema = await app_ctx.api_client.get_openapi_schema()
+    version = schema.get("info", {}).get("version")
+
+    # Comparing the fetched schema is still cheaper than serializing it again,
+    # and it catches changes that weren't accompanied by a version bump
+    cached = app_ctx.openapi_schema_json
+    if version is not None and cached is not None and cached[0] == schema:
+        return cached[1]
+
+    schema_json = _dumps(schema)
+    if version is not None:
+        app_ctx.openapi_schema_json = (schema, schema_json)
+    return schema_json
+
 
 async def main() -> None:
     """
@@ -72,9 +335,9 @@ async def main() -> None:
         config.agent_api_url = args.agent_api_url
     if args.agent_name:
         try:
-            config.agent_type = AgentType(args.agent_name.lower())
-        except ValueError:
-            logger.warning(f"Invalid agent type: {args.agent_name}")
+            config.agent_type = convert_to_agent_type(args.agent_name)
+        except ValueError as e:
+            logger.warning(str(e))
     if args.auto_start is not None:
         config.auto_start_agent = args.auto_start
     if args.debug is not None:
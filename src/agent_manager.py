@@ -134,6 +134,9 @@ def __init__(self, config: Config):
         # Track active operations for monitoring
         self._active_operations: Dict[str, Dict[str, Any]] = {}
 
+        # Commands shared by the per-agent probes of a detect_agents() run
+        self._detection_commands: Optional[Dict[Tuple[str, ...], asyncio.Future]] = None
+
         # Initialize agents
         self._initialize_agents()
 
@@ -341,7 +344,9 @@ async def detect_agents(self) -> Dict[AgentType, AgentInfo]:
                 except Exception as e:
                     logger.debug(f"Error checking if Agent API is running: {e}")
 
-                # Check each agent type with individual timeouts
+                # Check each agent type with individual timeouts. The probes run
+                # concurrently and share identical commands for this detection run.
+                self._detection_commands = {}
                 detection_tasks = []
                 for agent_type in AgentType:
                     # Skip detection if we already determined this agent is running
@@ -365,6 +370,8 @@ async def detect_agents(self) -> Dict[AgentType, AgentInfo]:
                         if not task.done():
                             task.cancel()
                     raise TimeoutError(f"Agent detection timed out after {timeout} seconds")
+                finally:
+                    self._detection_commands = None
 
                 # Log detection results
                 installed_agents = [
@@ -488,7 +495,7 @@ async def _detect_agent(self, agent_type: AgentType) -> None:
             # The command format is: agentapi server -- <agent> --help
             # This won't actually start the server but will check if the agent is recognized
             check_cmd = ["agentapi", "server", "--help"]
-            result = await self._run_command(check_cmd)
+            result = await self._run_detection_command(check_cmd)
 
             if result[0] == 0:
                 # Check if this agent type is mentioned in the help output
@@ -1576,6 +1583,30 @@ async def switch_agent(self, agent_type: AgentType) -> Optional[subprocess.Popen
                 logger.error(error_msg)
                 raise AgentSwitchError(error_msg)
 
+    async def _run_detection_command(self, command: List[str]) -> Tuple[int, str, str]:
+        """
+        Run a command used to probe agents.
+
+        During detect_agents() the same probe command is run once and its result is
+        shared by all agent probes; outside of it, the command is simply run.
+
+        Args:
+            command: Command to run as a list of strings
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        commands = self._detection_commands
+        if commands is None:
+            return await self._run_command(command)
+
+        key = tuple(command)
+        if key not in commands:
+            commands[key] = asyncio.ensure_future(self._run_command(command))
+
+        # Shield the shared run so a timed-out probe doesn't cancel it for the others
+        return await asyncio.shield(commands[key])
+
     async def _run_command(self, command: List[str]) -> Tuple[int, str, str]:
         """
         Run a command and return its output.
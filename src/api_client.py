@@ -548,7 +548,7 @@ async def get_message_list(self) -> List[Message]:
                 message = Message(
                     id=msg_data["id"],
                     content=msg_data["content"],
-                    role=ConversationRole(msg_data["role"]),
+                    role=msg_data["role"],
                     time=msg_data["time"]
                 )
                 messages.append(message)
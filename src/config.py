@@ -12,7 +12,9 @@
 import os
 import re
 import secrets
-from dataclasses import dataclass, field
+import stat
+import tempfile
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union, Callable
@@ -128,14 +130,12 @@ def mask_api_key(self) -> str:
         Returns:
             A masked version of the API key
         """
-        if not self.api_key:
+        key = self.api_key
+        if not key:
             return "<not set>"
 
-        # Show only first 4 and last 4 characters
-        if len(self.api_key) > 8:
-            return f"{self.api_key[:4]}...{self.api_key[-4:]}"
-        else:
-            return "****"  # For very short keys, just mask everything
+        # Show only first 4 and last 4 characters; for very short keys, mask everything
+        return f"{key[:4]}...{key[-4:]}" if len(key) > 8 else "****"
 
 
 @dataclass
@@ -188,6 +188,9 @@ def __post_init__(self):
         if not self.config_sources:
             self.config_sources.append("defaults")
 
+        # Agent types that have already been reported as unsupported
+        self._unsupported_agent_types: Set[AgentType] = set()
+
     def _init_agent_configs(self):
         """Initialize default agent configurations."""
         self.agent_configs = {
@@ -241,11 +244,15 @@ def get_agent_config(self, agent_type: AgentType) -> AgentConfig:
         Raises:
             ConfigurationError: If the agent type is not supported
         """
-        if agent_type not in self.agent_configs:
-            logger.warning(f"Unsupported agent type: {agent_type.value}, using CUSTOM")
-            return self.agent_configs[AgentType.CUSTOM]
+        agent_config = self.agent_configs.get(agent_type)
+        if agent_config is not None:
+            return agent_config
 
-        return self.agent_configs[agent_type]
+        # Only warn the first time an unsupported agent type is requested
+        if agent_type not in self._unsupported_agent_types:
+            self._unsupported_agent_types.add(agent_type)
+            logger.warning(f"Unsupported agent type: {agent_type.value}, using CUSTOM")
+        return self.agent_configs[AgentType.CUSTOM]
 
     def load_api_keys(self, validate: bool = True) -> Dict[AgentType, bool]:
         """
@@ -355,29 +362,27 @@ def to_dict(self) -> Dict[str, Any]:
         """
         agent_configs_dict = {}
         for agent_type, agent_config in self.agent_configs.items():
-            agent_configs_dict[agent_type.value] = {
-                "api_key_env": agent_config.api_key_env,
-                "api_key_set": bool(agent_config.api_key),
-                "api_key_validated": agent_config.api_key_validated,
-                "model": agent_config.model,
-                "api_key_required": agent_config.api_key_required,
-            }
-
-        return {
-            "agent_api_url": self.agent_api_url,
-            "auto_start_agent": self.auto_start_agent,
-            "agent_type": self.agent_type.value if self.agent_type else None,
-            "server": {
-                "transport": self.server.transport.value,
-                "host": self.server.host,
-                "port": self.server.port,
-            },
-            "debug": self.debug,
-            "config_version": self.config_version,
-            "config_sources": self.config_sources,
-            "validated": self.validated,
-            "agent_configs": agent_configs_dict,
-        }
+            agent_dict = {name: getattr(agent_config, name) for name in _AGENT_CONFIG_PUBLIC_FIELDS}
+            agent_dict["api_key_set"] = bool(agent_config.api_key)
+            agent_configs_dict[agent_type.value] = agent_dict
+
+        server_dict = {name: getattr(self.server, name) for name in _SERVER_CONFIG_FIELDS}
+        server_dict["transport"] = self.server.transport.value
+
+        result = {name: getattr(self, name) for name in _CONFIG_SCALAR_FIELDS}
+        result["agent_type"] = self.agent_type.value if self.agent_type else None
+        result["server"] = server_dict
+        result["agent_configs"] = agent_configs_dict
+        return result
+
+
+# Field names used by Config.to_dict, resolved once at import time.
+# API key values are never serialized; only whether a key is set.
+_SERVER_CONFIG_FIELDS = tuple(f.name for f in fields(ServerConfig))
+_CONFIG_SCALAR_FIELDS = tuple(
+    f.name for f in fields(Config) if f.name not in ("agent_type", "server", "agent_configs")
+)
+_AGENT_CONFIG_PUBLIC_FIELDS = ("api_key_env", "api_key_validated", "model", "api_key_required")
 
 
 def load_from_env() -> Config:
@@ -390,12 +395,15 @@ def load_from_env() -> Config:
     Raises:
         ConfigurationError: If the configuration is invalid
     """
+    # Bind the environment mapping once for the lookups below
+    env = os.environ
+
     # Create default config
     config = Config()
     config.config_sources.append("environment")
 
     # Load server configuration
-    transport_str = os.environ.get("TRANSPORT", "stdio").lower()
+    transport_str = env.get("TRANSPORT", "stdio").lower()
     try:
         config.server.transport = TransportType(transport_str)
     except ValueError:
@@ -404,8 +412,8 @@ def load_from_env() -> Config:
 
     try:
         # Load host and port with validation
-        config.server.host = os.environ.get("HOST", DEFAULT_HOST)
-        port_str = os.environ.get("PORT")
+        config.server.host = env.get("HOST", DEFAULT_HOST)
+        port_str = env.get("PORT")
         if port_str:
             try:
                 port = int(port_str)
@@ -419,10 +427,10 @@ def load_from_env() -> Config:
             config.server.port = DEFAULT_PORT
 
         # Load agent configuration
-        config.agent_api_url = os.environ.get("AGENT_API_URL", DEFAULT_AGENT_API_URL)
-        config.auto_start_agent = os.environ.get("AUTO_START_AGENT", "").lower() in ("true", "1", "yes")
+        config.agent_api_url = env.get("AGENT_API_URL", DEFAULT_AGENT_API_URL)
+        config.auto_start_agent = env.get("AUTO_START_AGENT", "").lower() in ("true", "1", "yes")
 
-        agent_type_str = os.environ.get("AGENT_TYPE")
+        agent_type_str = env.get("AGENT_TYPE")
         if agent_type_str:
             try:
                 config.agent_type = AgentType(agent_type_str.lower())
@@ -431,7 +439,7 @@ def load_from_env() -> Config:
                 config.agent_type = None
 
         # Load debug flag
-        config.debug = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
+        config.debug = env.get("DEBUG", "").lower() in ("true", "1", "yes")
 
         # Load API keys (without validation at this stage)
         config.load_api_keys(validate=False)
@@ -558,6 +566,7 @@ def save_config(config: Config, file_path: Union[str, Path] = CONFIG_FILE_NAME)
     Returns:
         True if the configuration was saved successfully, False otherwise
     """
+    tmp_path = None
     try:
         # Convert config to dictionary
         config_dict = {
@@ -573,15 +582,44 @@ def save_config(config: Config, file_path: Union[str, Path] = CONFIG_FILE_NAME)
             "config_version": config.config_version
         }
 
-        # Write to file
-        with open(file_path, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        # Serialize in a single pass, then write the buffer to a temporary file
+        # and atomically move it into place so readers never see a partial file.
+        # The temporary file gets a unique name in the target directory, so
+        # concurrent saves don't share it and os.replace stays on one filesystem.
+        data = json.dumps(config_dict, indent=2).encode("utf-8")
+        directory, name = os.path.split(os.path.abspath(file_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        # mkstemp creates the file readable by the owner only, so give it the
+        # mode of the file it replaces, or the mode open() would give a new file
+        try:
+            mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+        tmp_path = None
 
         logger.debug(f"Configuration saved to {file_path}")
         return True
     except Exception as e:
         logger.error(f"Error saving configuration to {file_path}: {e}")
         return False
+    finally:
+        # Don't leave the temporary file behind if the save failed
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
 
 def load_config() -> Config:
@@ -27,6 +27,16 @@
 DEFAULT_RETRY_BACKOFF_FACTOR = 2.0
 DEFAULT_RETRY_JITTER = 0.1
 
+# HTTP connection pool limits
+# Keep idle connections alive longer than the 30s health check interval so
+# periodic polls reuse the same connection instead of reconnecting each time
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+# How long agent detection results are reused before detecting again
+AGENT_DETECTION_TTL = 30.0
+
 # User agent for HTTP requests
 USER_AGENT = "mcp-agentapi/1.0"
 
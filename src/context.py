@@ -10,20 +10,23 @@
 import logging
 import os
 import subprocess
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 from mcp.server.fastmcp import FastMCP
 
 from .models import AgentType, ConversationRole
+from .api_client import AgentAPIClient
 from .event_emitter import EventEmitter
 from .config import Config, load_config
-from .agent_manager import AgentManager
+from .agent_manager import AgentInfo, AgentManager
 from .resource_manager import ResourceManager
 from .health_check import HealthCheck
+from .constants import AGENT_DETECTION_TTL, HTTP_KEEPALIVE_EXPIRY, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS
 
 # Configure logging
 logger = logging.getLogger("mcp-agentapi.context")
@@ -41,6 +44,7 @@ class AgentAPIContext:
     Attributes:
         http_client: HTTP client for communicating with the Agent API
         agent_api_url: URL of the Agent API server
+        api_client: Agent API client shared by all tools, built on http_client
         agent_type: Type of the agent (claude, goose, aider, etc.)
         config: Configuration object
         agent_manager: Agent Manager for detecting, installing, and managing agents
@@ -48,10 +52,15 @@ class AgentAPIContext:
         resource_manager: Resource Manager for tracking and cleaning up resources
         health_check: Health Check for monitoring the health of the server and its components
         agent_process: Process handle for the Agent API server if auto-started
+        agent_type_name: String value of agent_type, resolved once when the context is created
+        openapi_schema_json: Serialized OpenAPI schema as a (schema, JSON string) pair
+        agent_info_json: Serialized agent info as an (agent status, JSON string) pair
+        agent_detection_cache: Last agent detection result as a (monotonic time, agents) pair
     """
     # Core components
     http_client: httpx.AsyncClient
     agent_api_url: str
+    api_client: AgentAPIClient
     agent_type: AgentType
     config: Config
     agent_manager: AgentManager
@@ -62,6 +71,41 @@ class AgentAPIContext:
     # Optional components
     agent_process: Optional[subprocess.Popen] = None
 
+    # Derived values
+    agent_type_name: Optional[str] = field(init=False, default=None)
+
+    # Caches
+    openapi_schema_json: Optional[Tuple[Dict[str, Any], str]] = field(init=False, default=None)
+    agent_info_json: Optional[Tuple[str, str]] = field(init=False, default=None)
+    agent_detection_cache: Optional[Tuple[float, Dict[AgentType, AgentInfo]]] = field(init=False, default=None)
+
+    def __post_init__(self):
+        """Resolve derived values that tools read on every call."""
+        self.agent_type_name = self.agent_type.value if self.agent_type else None
+
+    async def detect_agents(self, force: bool = False) -> Dict[AgentType, AgentInfo]:
+        """
+        Detect available agents, reusing a recent detection result.
+
+        Detection probes the system for every agent type, so its result is reused
+        for AGENT_DETECTION_TTL seconds. The cached dictionary is the agent
+        manager's own agents map, so installs and starts made through the agent
+        manager are reflected without waiting for the TTL to expire.
+
+        Args:
+            force: Whether to detect agents again even if a recent result is cached
+
+        Returns:
+            Dictionary of agent information by agent type
+        """
+        cache = self.agent_detection_cache
+        if not force and cache is not None and time.monotonic() - cache[0] < AGENT_DETECTION_TTL:
+            return cache[1]
+
+        agents = await self.agent_manager.detect_agents()
+        self.agent_detection_cache = (time.monotonic(), agents)
+        return agents
+
 
 async def detect_agent_type(
     http_client: httpx.AsyncClient,
@@ -77,9 +121,6 @@ async def detect_agent_type(
     Returns:
         The detected agent type
     """
-    # Import here to avoid circular imports
-    from .api_client import AgentAPIClient
-
     try:
         # Create API client
         api_client = AgentAPIClient(http_client, agent_api_url)
@@ -225,7 +266,14 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
 
     # Initialize core components
     logger.info("Initializing core components...")
-    http_client = httpx.AsyncClient()
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+    )
+    api_client = AgentAPIClient(http_client, config.agent_api_url)
     resource_manager = ResourceManager()
     health_check = HealthCheck(config, http_client)
     agent_manager = AgentManager(config)
@@ -239,7 +287,8 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
 
     # Detect available agents
     logger.info("Detecting available agents...")
-    await agent_manager.detect_agents()
+    detected_agents = await agent_manager.detect_agents()
+    detected_at = time.monotonic()
 
     # Determine agent type (from config or detection)
     agent_type = None
@@ -280,7 +329,7 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
 
                 # Register the process with the resource manager
                 process_key = f"agent_{agent_type.value}"
-                await resource_manager.register_process(process_key, agent_process)
+                resource_manager.register_process(process_key, agent_process)
 
                 # Start agent monitoring in a background task
                 monitoring_task = asyncio.create_task(
@@ -288,7 +337,7 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
                 )
 
                 # Register the monitoring task with the resource manager
-                await resource_manager.register_task(f"monitor_{agent_type.value}", monitoring_task)
+                resource_manager.register_task(f"monitor_{agent_type.value}", monitoring_task)
                 logger.info(f"Agent monitoring started for {agent_type.value}")
             else:
                 logger.error(f"Failed to start Agent API server")
@@ -299,6 +348,7 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
     context = AgentAPIContext(
         http_client=http_client,
         agent_api_url=config.agent_api_url,
+        api_client=api_client,
         agent_type=agent_type,
         config=config,
         agent_manager=agent_manager,
@@ -307,6 +357,8 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
         health_check=health_check,
         agent_process=agent_process
     )
+    # Reuse the startup detection for the first tool calls
+    context.agent_detection_cache = (detected_at, detected_agents)
 
     # Start health check
     logger.info("Starting health check...")
@@ -318,7 +370,7 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
 
     # Register the event stream task with the resource manager
     if event_stream_task:
-        await resource_manager.register_task("event_stream", event_stream_task)
+        resource_manager.register_task("event_stream", event_stream_task)
 
     # Start screen stream in a background task (if supported by the Agent API)
     logger.info("Starting screen stream...")
@@ -326,7 +378,7 @@ async def agent_api_lifespan(server: FastMCP) -> AsyncIterator[AgentAPIContext]:
 
     # Register the screen stream task with the resource manager
     if screen_stream_task:
-        await resource_manager.register_task("screen_stream", screen_stream_task)
+        resource_manager.register_task("screen_stream", screen_stream_task)
 
     logger.info("Initialization complete, yielding context...")
 
@@ -130,7 +130,7 @@ async def _acquire_lock_and_start():
                 # Register with resource manager if available
                 if self._resource_manager:
                     try:
-                        await self._resource_manager.register_task("event_stream", self._stream_task)
+                        self._resource_manager.register_task("event_stream", self._stream_task)
                     except ResourceError as e:
                         logger.warning(f"Failed to register event stream task: {e}")
 
@@ -141,7 +141,7 @@ async def _acquire_lock_and_start():
                     # Register with resource manager if available
                     if self._resource_manager:
                         try:
-                            await self._resource_manager.register_task("event_health_check", self._health_check_task)
+                            self._resource_manager.register_task("event_health_check", self._health_check_task)
                         except ResourceError as e:
                             logger.warning(f"Failed to register health check task: {e}")
 
@@ -349,7 +349,7 @@ async def _acquire_lock_and_start():
                 # Register with resource manager if available
                 if self._resource_manager:
                     try:
-                        await self._resource_manager.register_task("screen_stream", self._screen_stream_task)
+                        self._resource_manager.register_task("screen_stream", self._screen_stream_task)
                     except ResourceError as e:
                         logger.warning(f"Failed to register screen stream task: {e}")
 
@@ -433,11 +433,11 @@ async def stop(self) -> None:
             if self._resource_manager:
                 try:
                     if self._stream_task:
-                        await self._resource_manager.unregister_task("event_stream")
+                        self._resource_manager.unregister_task("event_stream")
                     if self._screen_stream_task:
-                        await self._resource_manager.unregister_task("screen_stream")
+                        self._resource_manager.unregister_task("screen_stream")
                     if self._health_check_task:
-                        await self._resource_manager.unregister_task("event_health_check")
+                        self._resource_manager.unregister_task("event_health_check")
                 except ResourceError as e:
                     logger.warning(f"Error unregistering tasks from resource manager: {e}")
 
@@ -8,21 +8,53 @@
 """
 
 import asyncio
+import copy
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra; falls back to the stdlib json module
+    orjson = None
+
+try:
+    import psutil
+except ImportError:  # resource usage is reported as 0 without psutil
+    psutil = None
+
 from .exceptions import HealthCheckError
 from .models import AgentType
 from .config import Config
-from .constants import SNAPSHOT_INTERVAL
+from .constants import (
+    SNAPSHOT_INTERVAL,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
 
 # Configure logging
 logger = logging.getLogger("mcp-agentapi.health-check")
 
 
+# Health of the agent for each status value reported by the Agent API.
+# "running" means the agent is processing a request, which is still healthy.
+_AGENT_STATUS_HEALTH = {
+    "stable": "healthy",
+    "running": "healthy",
+}
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    """Parse a JSON response body, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class HealthCheck:
     """
     Health check for the MCP server.
@@ -38,19 +70,33 @@ class HealthCheck:
         _health_check_task: Background task for periodic health checks
         _last_check_time: Time of the last health check
         _health_status: Current health status
+        _cache_ttl_ok: Seconds a healthy result is reused by check_health
+        _cache_ttl_fail: Seconds a non-healthy result is reused by check_health
     """
 
-    def __init__(self, config: Config, http_client: httpx.AsyncClient):
+    def __init__(self, config: Config, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize the health check.
 
         Args:
             config: Configuration object
-            http_client: HTTP client for making requests
+            http_client: HTTP client for making requests. If not provided, the health
+                check creates its own pooled client and closes it in aclose().
         """
         self.config = config
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(5.0, connect=2.0),
+            )
         self.http_client = http_client
         self.agent_api_url = config.agent_api_url
+        self._status_url = f"{self.agent_api_url.rstrip('/')}/status"
         self._health_check_task: Optional[asyncio.Task] = None
         self._last_check_time = 0
         self._health_status: Dict[str, Any] = {
@@ -83,6 +129,28 @@ def __init__(self, config: Config, http_client: httpx.AsyncClient):
         self._check_interval = SNAPSHOT_INTERVAL * 1200  # 30 seconds (1200 * 25ms)
         self._is_running = False
         self._lock = asyncio.Lock()
+        self._stop_event = asyncio.Event()
+
+        # Cache check results so frequent callers don't hit the Agent API every time.
+        # Failures are cached for a shorter time so recovery is noticed quickly.
+        self._cache_ttl_ok = 27.0
+        self._cache_ttl_fail = 9.0
+        self._cache_expires_at = 0.0  # time.monotonic() deadline for the cached result
+
+        # Read-only view returned by get_health_status(), rebuilt after each check
+        self._status_view: Optional[Mapping[str, Any]] = None
+        self._status_view_key: Optional[float] = None
+
+        # The Agent API and agent checks both read /status; share one request between them
+        self._status_fetch: Optional[asyncio.Future] = None
+        self._status_fetched_at = 0.0
+        self._status_cache_ttl = 1.0
+
+        # Handle for sampling this process's resource usage. cpu_percent() is
+        # primed here so later non-blocking calls report usage since the last call.
+        self._process = psutil.Process() if psutil is not None else None
+        if self._process is not None:
+            self._process.cpu_percent(interval=None)
 
     async def start(self) -> None:
         """
@@ -97,6 +165,7 @@ async def start(self) -> None:
                 return
 
             self._is_running = True
+            self._stop_event.clear()
             self._health_check_task = asyncio.create_task(self._run_health_checks())
             logger.info("Health check started")
 
@@ -112,15 +181,37 @@ async def stop(self) -> None:
                 return
 
             self._is_running = False
+            self._stop_event.set()
             if self._health_check_task:
-                self._health_check_task.cancel()
+                # Let the loop exit on its own; only cancel it if a check is still
+                # in flight after the timeout
+                done, _ = await asyncio.wait({self._health_check_task}, timeout=5.0)
+                if not done:
+                    self._health_check_task.cancel()
                 try:
                     await self._health_check_task
                 except asyncio.CancelledError:
                     pass
                 self._health_check_task = None
+
+            # A cancelled check leaves its shielded status request running; let it
+            # finish so the connection goes back to the pool before the client closes
+            if self._status_fetch and not self._status_fetch.done():
+                await asyncio.wait({self._status_fetch}, timeout=5.0)
             logger.info("Health check stopped")
 
+    async def aclose(self) -> None:
+        """
+        Stop periodic health checks and release the HTTP client.
+
+        The HTTP client is only closed if it was created by the health check;
+        a client passed in by the caller remains the caller's responsibility.
+        """
+        if self._is_running:
+            await self.stop()
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
     async def _run_health_checks(self) -> None:
         """
         Run periodic health checks.
@@ -128,27 +219,45 @@ async def _run_health_checks(self) -> None:
         This method runs health checks on the MCP server and its components
         at regular intervals.
         """
-        while self._is_running:
+        while not self._stop_event.is_set():
             try:
-                await self.check_health()
-                await asyncio.sleep(self._check_interval)
+                await self.check_health(force=True)
+                delay = self._check_interval
             except asyncio.CancelledError:
                 logger.info("Health check task cancelled")
                 break
             except Exception as e:
                 logger.error(f"Error in health check: {e}")
-                await asyncio.sleep(5)  # Short delay before retrying after error
+                delay = 5  # Short delay before retrying after error
+
+            # Wait for the next check, waking up immediately if stop() is called
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                logger.info("Health check task cancelled")
+                break
 
-    async def check_health(self) -> Dict[str, Any]:
+    async def check_health(self, force: bool = False) -> Dict[str, Any]:
         """
         Check the health of the MCP server and its components.
 
         This method checks the health of the Agent API server, agent processes,
-        and other resources, and updates the health status.
+        and other resources, and updates the health status. Results are cached
+        for a short time; calls made while the cached result is still fresh
+        return it without re-running the component checks.
+
+        Args:
+            force: Run the component checks even if a cached result is available
 
         Returns:
-            Dictionary with health status information
+            Copy of the health status, which callers may modify freely
         """
+        now = time.monotonic()
+        if not force and now < self._cache_expires_at:
+            return copy.deepcopy(self._health_status)
+
         start_time = time.time()
         self._last_check_time = start_time
 
@@ -157,35 +266,46 @@ async def check_health(self) -> Dict[str, Any]:
         self._health_status["mcp_server"]["uptime"] = start_time - self._health_status["mcp_server"]["start_time"]
         self._health_status["mcp_server"]["status"] = "healthy"
 
+        # Run the component checks concurrently; they are independent of each other
+        agent_api_status, agent_status, resource_status = await asyncio.gather(
+            self._check_agent_api(),
+            self._check_agent(),
+            self._check_resources(),
+            return_exceptions=True,
+        )
+
         # Check Agent API status
-        try:
-            agent_api_status = await self._check_agent_api()
-            self._health_status["agent_api"] = agent_api_status
-        except Exception as e:
-            logger.error(f"Error checking Agent API health: {e}")
+        if isinstance(agent_api_status, Exception):
+            logger.error(f"Error checking Agent API health: {agent_api_status}")
             self._health_status["agent_api"]["status"] = "unhealthy"
             self._health_status["agent_api"]["last_check"] = start_time
-            self._health_status["agent_api"]["error"] = str(e)
+            self._health_status["agent_api"]["error"] = str(agent_api_status)
+        elif isinstance(agent_api_status, BaseException):
+            raise agent_api_status
+        else:
+            self._health_status["agent_api"] = agent_api_status
 
         # Check agent status
-        try:
-            agent_status = await self._check_agent()
-            self._health_status["agent"] = agent_status
-        except Exception as e:
-            logger.error(f"Error checking agent health: {e}")
+        if isinstance(agent_status, Exception):
+            logger.error(f"Error checking agent health: {agent_status}")
             self._health_status["agent"]["status"] = "unhealthy"
             self._health_status["agent"]["last_check"] = start_time
-            self._health_status["agent"]["error"] = str(e)
+            self._health_status["agent"]["error"] = str(agent_status)
+        elif isinstance(agent_status, BaseException):
+            raise agent_status
+        else:
+            self._health_status["agent"] = agent_status
 
         # Check resource usage
-        try:
-            resource_status = await self._check_resources()
-            self._health_status["resources"] = resource_status
-        except Exception as e:
-            logger.error(f"Error checking resource usage: {e}")
+        if isinstance(resource_status, Exception):
+            logger.error(f"Error checking resource usage: {resource_status}")
             self._health_status["resources"]["status"] = "unknown"
             self._health_status["resources"]["last_check"] = start_time
-            self._health_status["resources"]["error"] = str(e)
+            self._health_status["resources"]["error"] = str(resource_status)
+        elif isinstance(resource_status, BaseException):
+            raise resource_status
+        else:
+            self._health_status["resources"] = resource_status
 
         # Update overall status
         if (self._health_status["agent_api"]["status"] == "healthy" and
@@ -198,9 +318,36 @@ async def check_health(self) -> Dict[str, Any]:
         else:
             self._health_status["status"] = "degraded"
 
+        # Cache the result, keeping failures for a shorter time
+        ttl = self._cache_ttl_ok if self._health_status["status"] == "healthy" else self._cache_ttl_fail
+        self._cache_expires_at = now + ttl
+        self._health_status["timestamp"] = start_time
+        self._health_status["expires"] = start_time + ttl
+
         # Log health status
         logger.debug(f"Health check completed: {self._health_status['status']}")
-        return self._health_status
+        return copy.deepcopy(self._health_status)
+
+    async def _fetch_status(self) -> httpx.Response:
+        """
+        Fetch the Agent API status endpoint.
+
+        Concurrent callers share a single in-flight request, and the response is
+        reused for a short time so one health check cycle issues only one GET.
+
+        Returns:
+            The response from the status endpoint
+        """
+        now = time.monotonic()
+        fetch = self._status_fetch
+        if fetch is None or (fetch.done() and now - self._status_fetched_at >= self._status_cache_ttl):
+            fetch = asyncio.ensure_future(self.http_client.get(self._status_url, timeout=5.0))
+            self._status_fetch = fetch
+            self._status_fetched_at = now
+
+        # Shield the shared request so a cancelled caller neither cancels it for the
+        # others nor abandons the pooled connection in the middle of a response
+        return await asyncio.shield(fetch)
 
     async def _check_agent_api(self) -> Dict[str, Any]:
         """
@@ -221,14 +368,13 @@ async def _check_agent_api(self) -> Dict[str, Any]:
 
         try:
             # Make a request to the Agent API status endpoint
-            url = f"{self.agent_api_url.rstrip('/')}/status"
-            response = await self.http_client.get(url, timeout=5.0)
+            response = await self._fetch_status()
             end_time = time.time()
             status["response_time"] = end_time - start_time
 
             if response.status_code == 200:
                 status["status"] = "healthy"
-                status["response"] = response.json()
+                status["response"] = _parse_json(response)
             else:
                 status["status"] = "unhealthy"
                 status["error"] = f"Unexpected status code: {response.status_code}"
@@ -259,11 +405,10 @@ async def _check_agent(self) -> Dict[str, Any]:
 
         try:
             # Make a request to the Agent API status endpoint
-            url = f"{self.agent_api_url.rstrip('/')}/status"
-            response = await self.http_client.get(url, timeout=5.0)
+            response = await self._fetch_status()
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 agent_type = data.get("agentType", "unknown")
                 agent_status = data.get("status", "unknown")
 
@@ -271,12 +416,8 @@ async def _check_agent(self) -> Dict[str, Any]:
                 status["agent_status"] = agent_status
 
                 # Agent API returns "running" or "stable" as status values
-                if agent_status == "stable":
-                    status["status"] = "healthy"
-                elif agent_status == "running":
-                    status["status"] = "healthy"  # Agent is running and processing a request
-                else:
-                    status["status"] = "unknown"
+                status["status"] = _AGENT_STATUS_HEALTH.get(agent_status, "unknown")
+                if status["status"] == "unknown":
                     status["error"] = f"Unknown agent status: {agent_status}"
             else:
                 status["status"] = "unhealthy"
@@ -296,20 +437,61 @@ async def _check_resources(self) -> Dict[str, Any]:
         Returns:
             Dictionary with resource usage information
         """
-        # In a real implementation, we would check CPU, memory, disk usage, etc.
-        # For now, we'll just return a placeholder
-        return {
+        status = {
             "status": "healthy",
             "last_check": time.time(),
             "memory_usage": 0,
             "cpu_usage": 0,
         }
 
-    def get_health_status(self) -> Dict[str, Any]:
+        if self._process is not None:
+            # Sample in a worker thread so the syscalls never block the event loop
+            loop = asyncio.get_running_loop()
+            memory_usage, cpu_usage = await loop.run_in_executor(None, self._sample_resources)
+            status["memory_usage"] = memory_usage
+            status["cpu_usage"] = cpu_usage
+
+        return status
+
+    def _sample_resources(self) -> Tuple[int, float]:
+        """
+        Sample memory and CPU usage of the MCP server process.
+
+        Returns:
+            Tuple of resident memory in bytes and CPU usage percentage since the last sample
+        """
+        with self._process.oneshot():
+            return self._process.memory_info().rss, self._process.cpu_percent(interval=None)
+
+    def get_health_status(self) -> Mapping[str, Any]:
         """
         Get the current health status.
 
+        The status is returned as a read-only view, so callers can't modify the
+        health check's internal state. The view is only rebuilt after a new check
+        has completed. The component entries are read-only views too, so dict()
+        of the result is only a shallow snapshot; use get_health_status_dict()
+        for plain dictionaries that can be modified or serialized.
+
+        Returns:
+            Read-only mapping with health status information
+        """
+        if self._status_view is None or self._status_view_key != self._cache_expires_at:
+            self._status_view = MappingProxyType({
+                key: MappingProxyType(value) if isinstance(value, dict) else value
+                for key, value in self._health_status.items()
+            })
+            self._status_view_key = self._cache_expires_at
+        return self._status_view
+
+    def get_health_status_dict(self) -> Dict[str, Any]:
+        """
+        Get a copy of the current health status as plain dictionaries.
+
+        Unlike get_health_status(), the result is a deep copy that callers can
+        modify or serialize (e.g. with json.dumps()).
+
         Returns:
             Dictionary with health status information
         """
-        return self._health_status
+        return copy.deepcopy(self._health_status)
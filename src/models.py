@@ -7,6 +7,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Union
 
 
 class AgentType(str, Enum):
@@ -43,33 +44,61 @@ class EventType(str, Enum):
     SCREEN_UPDATE = "screen_update"
 
 
+# Value-to-member lookup tables, built once so string conversion is a dict lookup
+_CONVERSATION_ROLES = {role.value: role for role in ConversationRole}
+_AGENT_TYPES = {agent_type.value: agent_type for agent_type in AgentType}
+
+
+def _to_conversation_role(role: Union[str, ConversationRole]) -> ConversationRole:
+    """Convert a role string to a ConversationRole, raising ValueError if invalid."""
+    if isinstance(role, ConversationRole):
+        return role
+    return _CONVERSATION_ROLES.get(role) or ConversationRole(role)
+
+
 @dataclass
 class Message:
     """Message model based on Agent API schema."""
+    __slots__ = ("id", "content", "role", "time")
+
     id: int
     content: str
     role: ConversationRole
     time: str
 
+    def __post_init__(self):
+        """Accept the role as a plain string and convert it to ConversationRole."""
+        self.role = _to_conversation_role(self.role)
+
 
 @dataclass
 class MessageUpdateBody:
     """Message update event body."""
+    __slots__ = ("id", "role", "message", "time")
+
     id: int
     role: ConversationRole
     message: str
     time: str
 
+    def __post_init__(self):
+        """Accept the role as a plain string and convert it to ConversationRole."""
+        self.role = _to_conversation_role(self.role)
+
 
 @dataclass
 class StatusChangeBody:
     """Status change event body."""
+    __slots__ = ("status",)
+
     status: AgentStatus
 
 
 @dataclass
 class ScreenUpdateBody:
     """Screen update event body."""
+    __slots__ = ("screen",)
+
     screen: str
 
 
@@ -86,9 +115,9 @@ def convert_to_agent_type(agent_type_str: str) -> AgentType:
     Raises:
         ValueError: If the string is not a valid agent type
     """
-    try:
-        return AgentType(agent_type_str.lower())
-    except ValueError as e:
-        valid_types = ", ".join([t.value for t in AgentType])
-        raise ValueError(f"Invalid agent type: {agent_type_str}. Valid types are: {valid_types}") from e
+    agent_type = _AGENT_TYPES.get(agent_type_str.lower())
+    if agent_type is None:
+        valid_types = ", ".join(_AGENT_TYPES)
+        raise ValueError(f"Invalid agent type: {agent_type_str}. Valid types are: {valid_types}")
+    return agent_type
 
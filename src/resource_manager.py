@@ -10,14 +10,64 @@
 import logging
 import subprocess
 import time
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
 from .exceptions import ResourceError
 
 # Configure logging
 logger = logging.getLogger("mcp-agentapi.resource-manager")
 
+# Sentinel for dict.pop() lookups where None could be a valid value
+_MISSING = object()
+
+
+class _StatusSlots:
+    """
+    Pickle and copy support for the frozen, slotted status classes.
+
+    Frozen dataclasses block attribute assignment, which the default slot state
+    restoration relies on, so the state is restored with object.__setattr__.
+    """
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class ProcessStatus(_StatusSlots):
+    """Status of a tracked process."""
+    __slots__ = ("pid", "running", "returncode")
+
+    pid: int
+    running: bool
+    returncode: Optional[int]
+
+
+@dataclass(frozen=True)
+class TaskStatus(_StatusSlots):
+    """Status of a tracked task."""
+    __slots__ = ("done", "cancelled", "exception")
+
+    done: bool
+    cancelled: bool
+    exception: Optional[str]
+
+
+@dataclass(frozen=True)
+class CustomResourceStatus(_StatusSlots):
+    """Status of a tracked custom resource."""
+    __slots__ = ("type",)
+
+    type: str
+
 
 class ResourceManager:
     """
@@ -31,7 +81,13 @@ class ResourceManager:
         _processes: Dictionary of tracked processes
         _tasks: Dictionary of tracked asyncio tasks
         _custom_resources: Dictionary of custom resources with cleanup functions
-        _lock: Lock for thread-safe access to resources
+        _status_cache: Last computed status entry for each resource, keyed by (kind, key)
+        _status_dirty: Resources whose status entry must be recomputed, as (kind, key)
+
+    ResourceManager assumes all operations occur on a single event loop, so it
+    doesn't lock: each check-and-update of its dictionaries runs without an
+    await in between and can't interleave with another coroutine. For multi-loop
+    use, instantiate one per loop.
     """
 
     def __init__(self):
@@ -39,9 +95,10 @@ def __init__(self):
         self._processes: Dict[str, subprocess.Popen] = {}
         self._tasks: Dict[str, asyncio.Task] = {}
         self._custom_resources: Dict[str, Tuple[Any, Callable]] = {}
-        self._lock = asyncio.Lock()
+        self._status_cache: Dict[Tuple[str, str], Union[ProcessStatus, TaskStatus, CustomResourceStatus]] = {}
+        self._status_dirty: Set[Tuple[str, str]] = set()
 
-    async def register_process(self, key: str, process: subprocess.Popen) -> None:
+    def register_process(self, key: str, process: subprocess.Popen) -> None:
         """
         Register a process for tracking.
 
@@ -52,13 +109,12 @@ async def register_process(self, key: str, process: subprocess.Popen) -> None:
         Raises:
             ResourceError: If a process with the same key is already registered
         """
-        async with self._lock:
-            if key in self._processes:
-                raise ResourceError(f"Process with key '{key}' already registered")
-            self._processes[key] = process
-            logger.debug(f"Registered process '{key}' with PID {process.pid}")
+        if self._processes.setdefault(key, process) is not process:
+            raise ResourceError(f"Process with key '{key}' already registered")
+        self._status_dirty.add(("processes", key))
+        logger.debug(f"Registered process '{key}' with PID {process.pid}")
 
-    async def register_task(self, key: str, task: asyncio.Task) -> None:
+    def register_task(self, key: str, task: asyncio.Task) -> None:
         """
         Register an asyncio task for tracking.
 
@@ -69,13 +125,14 @@ async def register_task(self, key: str, task: asyncio.Task) -> None:
         Raises:
             ResourceError: If a task with the same key is already registered
         """
-        async with self._lock:
-            if key in self._tasks:
-                raise ResourceError(f"Task with key '{key}' already registered")
-            self._tasks[key] = task
-            logger.debug(f"Registered task '{key}'")
-
-    async def register_custom_resource(
+        if self._tasks.setdefault(key, task) is not task:
+            raise ResourceError(f"Task with key '{key}' already registered")
+        self._status_dirty.add(("tasks", key))
+        # A task's status only changes once, when it finishes
+        task.add_done_callback(lambda _, key=key: self._status_dirty.add(("tasks", key)))
+        logger.debug(f"Registered task '{key}'")
+
+    def register_custom_resource(
         self, key: str, resource: Any, cleanup_func: Callable
     ) -> None:
         """
@@ -89,13 +146,13 @@ async def register_custom_resource(
         Raises:
             ResourceError: If a resource with the same key is already registered
         """
-        async with self._lock:
-            if key in self._custom_resources:
-                raise ResourceError(f"Custom resource with key '{key}' already registered")
-            self._custom_resources[key] = (resource, cleanup_func)
-            logger.debug(f"Registered custom resource '{key}'")
+        entry = (resource, cleanup_func)
+        if self._custom_resources.setdefault(key, entry) is not entry:
+            raise ResourceError(f"Custom resource with key '{key}' already registered")
+        self._status_dirty.add(("custom_resources", key))
+        logger.debug(f"Registered custom resource '{key}'")
 
-    async def unregister_process(self, key: str) -> Optional[subprocess.Popen]:
+    def unregister_process(self, key: str) -> Optional[subprocess.Popen]:
         """
         Unregister a process without stopping it.
 
@@ -108,14 +165,14 @@ async def unregister_process(self, key: str) -> Optional[subprocess.Popen]:
         Raises:
             ResourceError: If the process is not registered
         """
-        async with self._lock:
-            if key not in self._processes:
-                raise ResourceError(f"Process with key '{key}' not registered")
-            process = self._processes.pop(key)
-            logger.debug(f"Unregistered process '{key}'")
-            return process
-
-    async def unregister_task(self, key: str) -> Optional[asyncio.Task]:
+        process = self._processes.pop(key, _MISSING)
+        if process is _MISSING:
+            raise ResourceError(f"Process with key '{key}' not registered")
+        self._forget_status("processes", key)
+        logger.debug(f"Unregistered process '{key}'")
+        return process
+
+    def unregister_task(self, key: str) -> Optional[asyncio.Task]:
         """
         Unregister a task without cancelling it.
 
@@ -128,14 +185,14 @@ async def unregister_task(self, key: str) -> Optional[asyncio.Task]:
         Raises:
             ResourceError: If the task is not registered
         """
-        async with self._lock:
-            if key not in self._tasks:
-                raise ResourceError(f"Task with key '{key}' not registered")
-            task = self._tasks.pop(key)
-            logger.debug(f"Unregistered task '{key}'")
-            return task
-
-    async def unregister_custom_resource(self, key: str) -> Optional[Any]:
+        task = self._tasks.pop(key, _MISSING)
+        if task is _MISSING:
+            raise ResourceError(f"Task with key '{key}' not registered")
+        self._forget_status("tasks", key)
+        logger.debug(f"Unregistered task '{key}'")
+        return task
+
+    def unregister_custom_resource(self, key: str) -> Optional[Any]:
         """
         Unregister a custom resource without cleaning it up.
 
@@ -148,12 +205,13 @@ async def unregister_custom_resource(self, key: str) -> Optional[Any]:
         Raises:
             ResourceError: If the resource is not registered
         """
-        async with self._lock:
-            if key not in self._custom_resources:
-                raise ResourceError(f"Custom resource with key '{key}' not registered")
-            resource, _ = self._custom_resources.pop(key)
-            logger.debug(f"Unregistered custom resource '{key}'")
-            return resource
+        entry = self._custom_resources.pop(key, _MISSING)
+        if entry is _MISSING:
+            raise ResourceError(f"Custom resource with key '{key}' not registered")
+        self._forget_status("custom_resources", key)
+        resource, _ = entry
+        logger.debug(f"Unregistered custom resource '{key}'")
+        return resource
 
     @asynccontextmanager
     async def track_process(self, key: str, process: subprocess.Popen):
@@ -170,12 +228,12 @@ async def track_process(self, key: str, process: subprocess.Popen):
         Raises:
             ResourceError: If a process with the same key is already registered
         """
-        await self.register_process(key, process)
+        self.register_process(key, process)
         try:
             yield process
         finally:
             try:
-                await self.stop_process(key)
+                await self._finish_cleanup(self.stop_process(key))
             except ResourceError:
                 # Process might have already been unregistered
                 pass
@@ -195,22 +253,56 @@ async def track_task(self, key: str, task: asyncio.Task):
         Raises:
             ResourceError: If a task with the same key is already registered
         """
-        await self.register_task(key, task)
+        self.register_task(key, task)
         try:
             yield task
         finally:
             try:
-                await self.cancel_task(key)
+                await self._finish_cleanup(self.cancel_task(key))
             except ResourceError:
                 # Task might have already been unregistered
                 pass
 
+    async def _finish_cleanup(self, cleanup: Awaitable[None]) -> None:
+        """
+        Run a cleanup coroutine to completion, even if the caller is cancelled.
+
+        The cleanup is shielded from cancellation of the awaiting task. If that
+        task is cancelled, even repeatedly, the cleanup is allowed to finish
+        before the CancelledError is re-raised; the cleanups used here are
+        bounded by their own timeouts.
+
+        Args:
+            cleanup: Cleanup coroutine to run
+
+        Raises:
+            asyncio.CancelledError: If the awaiting task was cancelled
+            Any exception raised by the cleanup itself
+        """
+        cleanup_task = asyncio.ensure_future(cleanup)
+        try:
+            await asyncio.shield(cleanup_task)
+        except asyncio.CancelledError:
+            # asyncio.wait() doesn't cancel the task it waits on; keep waiting if
+            # the caller is cancelled again while the cleanup is still running
+            while not cleanup_task.done():
+                try:
+                    await asyncio.wait({cleanup_task})
+                except asyncio.CancelledError:
+                    pass
+            if not cleanup_task.cancelled():
+                # Mark the cleanup's exception (if any) as retrieved
+                cleanup_task.exception()
+            raise
+
     async def stop_process(self, key: str, timeout: float = 5.0) -> None:
         """
         Stop a process and unregister it.
 
         This method attempts to gracefully terminate the process first, then
-        forcefully kills it if it doesn't terminate within the timeout.
+        forcefully kills it if it doesn't terminate within the timeout. Waiting
+        for the process happens in a worker thread, so the event loop keeps
+        running while the process shuts down.
         It also handles cleanup of process resources and ensures proper
         unregistration even if errors occur.
 
@@ -221,97 +313,68 @@ async def stop_process(self, key: str, timeout: float = 5.0) -> None:
         Raises:
             ResourceError: If the process is not registered
         """
-        process = None
+        process = self._processes.get(key)
+        if process is None:
+            raise ResourceError(f"Process with key '{key}' not registered")
 
-        # First get the process under the lock
-        async with self._lock:
-            if key not in self._processes:
-                raise ResourceError(f"Process with key '{key}' not registered")
+        logger.info(f"Stopping process '{key}' with PID {process.pid}")
 
-            process = self._processes[key]
-            logger.info(f"Stopping process '{key}' with PID {process.pid}")
+        try:
+            # Check if process is still running
+            if process.poll() is None:
+                loop = asyncio.get_running_loop()
 
-        # Perform the actual termination outside the lock to avoid blocking
-        # other operations while waiting for the process to terminate
-        if process:
-            try:
-                # Check if process is still running
-                if process.poll() is None:
-                    # Try graceful termination first
-                    try:
-                        logger.debug(f"Attempting graceful termination of process '{key}'")
-                        process.terminate()
+                # Try graceful termination first
+                try:
+                    logger.debug(f"Attempting graceful termination of process '{key}'")
+                    process.terminate()
 
-                        # Wait for the process to terminate with a timeout
+                    # Wait for the process in a worker thread, so a slow exit
+                    # doesn't block the event loop
+                    try:
+                        exit_code = await loop.run_in_executor(None, partial(process.wait, timeout))
+                        logger.info(f"Process '{key}' terminated gracefully with exit code {exit_code}")
+                    except subprocess.TimeoutExpired:
+                        # If graceful termination fails, force kill
+                        logger.warning(f"Process '{key}' did not terminate gracefully after {timeout}s, killing it")
+                        process.kill()
+
+                        # Wait again with a shorter timeout
                         try:
-                            exit_code = process.wait(timeout=timeout)
-                            logger.info(f"Process '{key}' terminated gracefully with exit code {exit_code}")
+                            exit_code = await loop.run_in_executor(None, partial(process.wait, 2.0))
+                            logger.info(f"Process '{key}' killed with exit code {exit_code}")
                         except subprocess.TimeoutExpired:
-                            # If graceful termination fails, force kill
-                            logger.warning(f"Process '{key}' did not terminate gracefully after {timeout}s, forcing...")
-
-                            # Try SIGINT first for a more graceful shutdown
-                            if hasattr(subprocess, 'SIGINT'):
-                                try:
-                                    import signal
-                                    process.send_signal(signal.SIGINT)
-                                    # Give it a short time to respond to SIGINT
-                                    exit_code = process.wait(timeout=2.0)
-                                    logger.info(f"Process '{key}' terminated with SIGINT, exit code {exit_code}")
-                                except subprocess.TimeoutExpired:
-                                    # If SIGINT fails, use SIGKILL
-                                    logger.warning(f"Process '{key}' did not respond to SIGINT, using SIGKILL")
-                                    process.kill()
-
-                                    # Wait again with a shorter timeout
-                                    try:
-                                        exit_code = process.wait(timeout=2.0)
-                                        logger.info(f"Process '{key}' killed with exit code {exit_code}")
-                                    except subprocess.TimeoutExpired:
-                                        logger.error(f"Failed to kill process '{key}', it may be zombie or blocked")
-                                except Exception as e:
-                                    logger.error(f"Error sending SIGINT to process '{key}': {e}")
-                                    # Fall back to kill
-                                    process.kill()
-                            else:
-                                # If SIGINT is not available, use kill directly
-                                process.kill()
-
-                                # Wait again with a shorter timeout
-                                try:
-                                    exit_code = process.wait(timeout=2.0)
-                                    logger.info(f"Process '{key}' killed with exit code {exit_code}")
-                                except subprocess.TimeoutExpired:
-                                    logger.error(f"Failed to kill process '{key}', it may be zombie or blocked")
-                    except Exception as e:
-                        logger.error(f"Error terminating process '{key}': {e}")
-                        # Try to force kill as a last resort
-                        try:
-                            process.kill()
-                        except Exception as kill_error:
-                            logger.error(f"Error force killing process '{key}': {kill_error}")
-                else:
-                    logger.info(f"Process '{key}' already terminated with exit code {process.returncode}")
-
-                # Clean up process resources
-                try:
-                    # Close any open file descriptors
-                    if process.stdout:
-                        process.stdout.close()
-                    if process.stderr:
-                        process.stderr.close()
-                    if process.stdin:
-                        process.stdin.close()
+                            logger.error(f"Failed to kill process '{key}', it may be zombie or blocked")
                 except Exception as e:
-                    logger.warning(f"Error closing process streams for '{key}': {e}")
+                    logger.error(f"Error terminating process '{key}': {e}")
+                    # Try to force kill as a last resort
+                    try:
+                        process.kill()
+                    except Exception as kill_error:
+                        logger.error(f"Error force killing process '{key}': {kill_error}")
+            else:
+                logger.info(f"Process '{key}' already terminated with exit code {process.returncode}")
+
+            # Clean up process resources
+            try:
+                # Close any open file descriptors
+                if process.stdout:
+                    process.stdout.close()
+                if process.stderr:
+                    process.stderr.close()
+                if process.stdin:
+                    process.stdin.close()
             except Exception as e:
-                logger.error(f"Unexpected error stopping process '{key}': {e}")
+                logger.warning(f"Error closing process streams for '{key}': {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error stopping process '{key}': {e}")
 
-            # Finally, remove the process from tracking under the lock
-            async with self._lock:
-                if key in self._processes:
-                    del self._processes[key]
-                    logger.debug(f"Process '{key}' unregistered from resource manager")
+        # Finally, remove the process from tracking, unless the key was
+        # reused for another process while this one was shutting down
+        if self._processes.get(key) is process:
+            del self._processes[key]
+            self._forget_status("processes", key)
+            logger.debug(f"Process '{key}' unregistered from resource manager")
 
     async def cancel_task(self, key: str, timeout: float = 5.0) -> None:
         """
@@ -324,28 +387,29 @@ async def cancel_task(self, key: str, timeout: float = 5.0) -> None:
         Raises:
             ResourceError: If the task is not registered
         """
-        async with self._lock:
-            if key not in self._tasks:
-                raise ResourceError(f"Task with key '{key}' not registered")
+        task = self._tasks.get(key)
+        if task is None:
+            raise ResourceError(f"Task with key '{key}' not registered")
 
-            task = self._tasks[key]
-            logger.info(f"Cancelling task '{key}'")
+        logger.info(f"Cancelling task '{key}'")
 
-            # Cancel the task if it's not done
-            if not task.done():
-                task.cancel()
-
-                # Wait for the task to be cancelled with a timeout
-                try:
-                    await asyncio.wait_for(asyncio.gather(task, return_exceptions=True), timeout=timeout)
-                    logger.info(f"Task '{key}' cancelled")
-                except asyncio.TimeoutError:
-                    logger.error(f"Failed to cancel task '{key}' within {timeout}s")
-            else:
-                logger.info(f"Task '{key}' already completed")
+        # Cancel the task if it's not done
+        if not task.done():
+            task.cancel()
 
-            # Remove the task from tracking
+            # Wait for the task to be cancelled with a timeout
+            try:
+                await asyncio.wait_for(asyncio.gather(task, return_exceptions=True), timeout=timeout)
+                logger.info(f"Task '{key}' cancelled")
+            except asyncio.TimeoutError:
+                logger.error(f"Failed to cancel task '{key}' within {timeout}s")
+        else:
+            logger.info(f"Task '{key}' already completed")
+
+        # Remove the task from tracking, unless the key was reused while waiting
+        if self._tasks.get(key) is task:
             del self._tasks[key]
+            self._forget_status("tasks", key)
 
     async def cleanup_custom_resource(self, key: str) -> None:
         """
@@ -357,25 +421,27 @@ async def cleanup_custom_resource(self, key: str) -> None:
         Raises:
             ResourceError: If the resource is not registered
         """
-        async with self._lock:
-            if key not in self._custom_resources:
-                raise ResourceError(f"Custom resource with key '{key}' not registered")
+        entry = self._custom_resources.get(key)
+        if entry is None:
+            raise ResourceError(f"Custom resource with key '{key}' not registered")
 
-            resource, cleanup_func = self._custom_resources[key]
-            logger.info(f"Cleaning up custom resource '{key}'")
+        resource, cleanup_func = entry
+        logger.info(f"Cleaning up custom resource '{key}'")
 
-            # Call the cleanup function
-            try:
-                if asyncio.iscoroutinefunction(cleanup_func):
-                    await cleanup_func(resource)
-                else:
-                    cleanup_func(resource)
-                logger.info(f"Custom resource '{key}' cleaned up")
-            except Exception as e:
-                logger.error(f"Error cleaning up custom resource '{key}': {e}")
+        # Call the cleanup function
+        try:
+            if asyncio.iscoroutinefunction(cleanup_func):
+                await cleanup_func(resource)
+            else:
+                cleanup_func(resource)
+            logger.info(f"Custom resource '{key}' cleaned up")
+        except Exception as e:
+            logger.error(f"Error cleaning up custom resource '{key}': {e}")
 
-            # Remove the resource from tracking
+        # Remove the resource from tracking, unless the key was reused while cleaning up
+        if self._custom_resources.get(key) is entry:
             del self._custom_resources[key]
+            self._forget_status("custom_resources", key)
 
     async def cleanup_all(self) -> None:
         """
@@ -387,68 +453,104 @@ async def cleanup_all(self) -> None:
         logger.info("Cleaning up all resources")
 
         # Get a snapshot of all resources to avoid modification during iteration
-        async with self._lock:
-            process_keys = list(self._processes.keys())
-            task_keys = list(self._tasks.keys())
-            custom_resource_keys = list(self._custom_resources.keys())
+        process_keys = list(self._processes.keys())
+        task_keys = list(self._tasks.keys())
+        custom_resource_keys = list(self._custom_resources.keys())
+
+        # Clean up all resources concurrently, so shutdown takes as long as the
+        # slowest cleanup rather than the sum of all of them
+        cleanups = [
+            *(("stopping process", key, self.stop_process(key)) for key in process_keys),
+            *(("cancelling task", key, self.cancel_task(key)) for key in task_keys),
+            *(("cleaning up custom resource", key, self.cleanup_custom_resource(key))
+              for key in custom_resource_keys),
+        ]
+        results = await asyncio.gather(
+            *(cleanup for _, _, cleanup in cleanups), return_exceptions=True
+        )
+
+        for (action, key, _), result in zip(cleanups, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error {action} '{key}': {result}")
 
-        # Clean up processes
-        for key in process_keys:
-            try:
-                await self.stop_process(key)
-            except Exception as e:
-                logger.error(f"Error stopping process '{key}': {e}")
+        logger.info("All resources cleaned up")
 
-        # Clean up tasks
-        for key in task_keys:
-            try:
-                await self.cancel_task(key)
-            except Exception as e:
-                logger.error(f"Error cancelling task '{key}': {e}")
+    def _forget_status(self, kind: str, key: str) -> None:
+        """
+        Drop the cached status of a resource that is no longer tracked.
 
-        # Clean up custom resources
-        for key in custom_resource_keys:
-            try:
-                await self.cleanup_custom_resource(key)
-            except Exception as e:
-                logger.error(f"Error cleaning up custom resource '{key}': {e}")
+        Args:
+            kind: Resource kind ("processes", "tasks" or "custom_resources")
+            key: Unique identifier for the resource
+        """
+        self._status_cache.pop((kind, key), None)
+        self._status_dirty.discard((kind, key))
 
-        logger.info("All resources cleaned up")
+    def _refresh_status(self) -> None:
+        """
+        Recompute the cached status of resources marked dirty.
+
+        Running processes stay dirty, since nothing notifies the resource manager
+        when they exit. Tasks are marked dirty again by a done callback, and custom
+        resources never change after registration.
+        """
+        still_dirty: Set[Tuple[str, str]] = set()
+
+        for kind, key in self._status_dirty:
+            if kind == "processes":
+                process = self._processes.get(key)
+                if process is None:
+                    continue
+                running = process.poll() is None
+                entry = ProcessStatus(
+                    pid=process.pid,
+                    running=running,
+                    returncode=process.returncode
+                )
+                if running:
+                    still_dirty.add((kind, key))
+            elif kind == "tasks":
+                task = self._tasks.get(key)
+                if task is None:
+                    continue
+                done = task.done()
+                entry = TaskStatus(
+                    done=done,
+                    cancelled=task.cancelled() if done else False,
+                    exception=str(task.exception()) if done and not task.cancelled() and task.exception() else None
+                )
+            else:
+                entry_data = self._custom_resources.get(key)
+                if entry_data is None:
+                    continue
+                entry = CustomResourceStatus(
+                    type=type(entry_data[0]).__name__
+                )
+
+            self._status_cache[(kind, key)] = entry
+
+        self._status_dirty = still_dirty
 
     async def get_resource_status(self) -> Dict[str, Dict[str, Any]]:
         """
         Get the status of all tracked resources.
 
+        Only resources whose status may have changed since the last call are
+        polled again; the rest are served from the status cache. Status entries
+        are immutable ProcessStatus, TaskStatus and CustomResourceStatus objects,
+        so cached entries are returned without copying. Use dataclasses.asdict()
+        to convert an entry to a dictionary.
+
         Returns:
             Dictionary with the status of all tracked resources
         """
-        async with self._lock:
-            status = {
-                "processes": {},
-                "tasks": {},
-                "custom_resources": {}
+        self._refresh_status()
+        cache = self._status_cache
+
+        return {
+            "processes": {key: cache[("processes", key)] for key in self._processes},
+            "tasks": {key: cache[("tasks", key)] for key in self._tasks},
+            "custom_resources": {
+                key: cache[("custom_resources", key)] for key in self._custom_resources
             }
-
-            # Get process status
-            for key, process in self._processes.items():
-                status["processes"][key] = {
-                    "pid": process.pid,
-                    "running": process.poll() is None,
-                    "returncode": process.returncode
-                }
-
-            # Get task status
-            for key, task in self._tasks.items():
-                status["tasks"][key] = {
-                    "done": task.done(),
-                    "cancelled": task.cancelled() if task.done() else False,
-                    "exception": str(task.exception()) if task.done() and not task.cancelled() and task.exception() else None
-                }
-
-            # Get custom resource status
-            for key, (resource, _) in self._custom_resources.items():
-                status["custom_resources"][key] = {
-                    "type": type(resource).__name__
-                }
-
-            return status
+        }
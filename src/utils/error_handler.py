@@ -10,12 +10,20 @@
 import traceback
 from typing import Any, Dict, Optional, Union
 
-from ..exceptions import MCPServerError, AgentAPIError
+from ..exceptions import MCPServerError, AgentAPIError, ConfigurationError
 from ..constants import CORS_HEADERS
 
 # Configure logging
 logger = logging.getLogger("mcp-agentapi.error-handler")
 
+# Map exception classes to HTTP status codes. Lookups walk the exception's MRO,
+# so subclasses inherit the status code of their nearest mapped ancestor.
+_STATUS_MAP: Dict[type, int] = {
+    MCPServerError: 500,
+    AgentAPIError: 500,
+    ConfigurationError: 400,
+}
+
 def create_error_response(
     error_message: str,
     error_type: str = "AgentAPIError",
@@ -85,39 +93,45 @@ def handle_exception(
         A dictionary with the standardized error format
     """
     # Get the exception details
+    exception_class = type(exception)
     error_message = str(exception)
-    error_type = exception.__class__.__name__
-    
-    # Default status code
+    error_type = exception_class.__name__
+
+    # Resolve the status code from the dispatch table (default: 500)
     status_code = 500
-    
+    for cls in exception_class.__mro__:
+        if cls in _STATUS_MAP:
+            status_code = _STATUS_MAP[cls]
+            break
+
     # Default detail
     detail = None
-    
+
     # Default context
     context = None
-    
+
     # Handle MCPServerError exceptions
     if isinstance(exception, MCPServerError):
         # Use the exception's message
         error_message = exception.message
-        
+
         # Get the context from the exception
         context = exception.context
-        
+
         # Include traceback if requested and available
         if include_traceback and exception.traceback:
             detail = exception.traceback
-    
+
     # Handle AgentAPIError exceptions
     if isinstance(exception, AgentAPIError):
         # Use the status code from the exception if available
-        status_code = getattr(exception, 'status_code', 500)
-    
+        if exception.status_code is not None:
+            status_code = exception.status_code
+
     # For other exceptions, capture the traceback if requested
     elif include_traceback:
         detail = traceback.format_exc()
-    
+
     # Log the error if requested
     if log_error:
         logger.error(f"Exception: {error_type}: {error_message}")
@@ -3,8 +3,11 @@
 """
 import sys
 import os
+import time
 from unittest import mock
 
+import pytest
+
 # Add the parent directory to the Python path
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
@@ -17,3 +20,51 @@
 sys.modules['src.context'] = mock.MagicMock()
 sys.modules['src.api_client'] = mock.MagicMock()
 sys.modules['src.utils.error_handler'] = mock.MagicMock()
+
+
+@pytest.fixture
+def real_modules():
+    """
+    Use the real src and mcp_agentapi modules instead of the mocks above.
+
+    Modules imported during the test are discarded afterwards, and the mocks
+    are restored for the other tests.
+    """
+    with mock.patch.dict(sys.modules):
+        for name in list(sys.modules):
+            if name.split(".")[0] in ("src", "mcp_agentapi"):
+                del sys.modules[name]
+        yield
+
+
+class FakeClock:
+    """
+    Stand-in for the time module with a controllable monotonic clock.
+
+    Anything other than monotonic() is taken from the real time module.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    Replace the time module used by a module with a FakeClock.
+
+    Call the fixture with the module to patch; it returns the clock. Only the
+    module's own reference is patched, so the event loop keeps the real clock.
+    """
+    def install(module):
+        clock = FakeClock()
+        monkeypatch.setattr(module, "time", clock)
+        return clock
+
+    return install
@@ -0,0 +1,62 @@
+"""
+Tests for saving the configuration file.
+"""
+import json
+import os
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def config_module(real_modules):
+    """Import the real config module."""
+    from src import config
+    return config
+
+
+def test_save_config(config_module, tmp_path):
+    """The configuration is written to the target file and nothing else."""
+    file_path = tmp_path / "config.json"
+
+    assert config_module.save_config(config_module.Config(debug=True), file_path)
+
+    assert json.loads(file_path.read_text())["debug"] is True
+    assert os.listdir(tmp_path) == ["config.json"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_save_config_new_file_mode(config_module, tmp_path):
+    """A new configuration file gets the default mode for the current umask."""
+    file_path = tmp_path / "config.json"
+    umask = os.umask(0o027)
+    try:
+        assert config_module.save_config(config_module.Config(), file_path)
+    finally:
+        os.umask(umask)
+
+    assert file_path.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_save_config_keeps_existing_mode(config_module, tmp_path):
+    """Saving over an existing configuration file keeps its mode."""
+    file_path = tmp_path / "config.json"
+    file_path.write_text("{}")
+    file_path.chmod(0o600)
+
+    assert config_module.save_config(config_module.Config(), file_path)
+
+    assert file_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_save_config_removes_temp_file_on_failure(config_module, tmp_path):
+    """A failed save leaves the existing file untouched and no temporary file behind."""
+    file_path = tmp_path / "config.json"
+    file_path.write_text("{}")
+
+    with mock.patch.object(config_module.os, "replace", side_effect=OSError("disk full")):
+        assert not config_module.save_config(config_module.Config(), file_path)
+
+    assert file_path.read_text() == "{}"
+    assert os.listdir(tmp_path) == ["config.json"]
@@ -0,0 +1,70 @@
+"""
+Tests for the MCP server context.
+"""
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def context_module(real_modules):
+    """Import the real context module."""
+    from src import context
+    return context
+
+
+@pytest.fixture
+def clock(context_module, fake_clock):
+    """Replace the clock used by the context module."""
+    return fake_clock(context_module)
+
+
+@pytest.fixture
+def app_context(context_module):
+    """Create a context with a mock agent manager."""
+    from src.models import AgentType
+
+    agent_manager = mock.MagicMock()
+    agent_manager.detect_agents = mock.AsyncMock(return_value={})
+    return context_module.AgentAPIContext(
+        http_client=mock.MagicMock(),
+        agent_api_url="http://agent",
+        api_client=mock.MagicMock(),
+        agent_type=AgentType.GOOSE,
+        config=mock.MagicMock(),
+        agent_manager=agent_manager,
+        event_emitter=mock.MagicMock(),
+        resource_manager=mock.MagicMock(),
+        health_check=mock.MagicMock(),
+    )
+
+
+async def test_detect_agents_cached_within_ttl(app_context, clock):
+    """Detection runs once for calls within the TTL."""
+    first = await app_context.detect_agents()
+    clock.now += 29
+    second = await app_context.detect_agents()
+
+    assert first is second
+    app_context.agent_manager.detect_agents.assert_awaited_once()
+
+
+async def test_detect_agents_after_ttl(app_context, clock):
+    """Detection runs again once the TTL has passed."""
+    await app_context.detect_agents()
+    clock.now += 31
+    await app_context.detect_agents()
+
+    assert app_context.agent_manager.detect_agents.await_count == 2
+
+
+async def test_detect_agents_force(app_context, clock):
+    """force=True runs detection even within the TTL."""
+    await app_context.detect_agents()
+    await app_context.detect_agents(force=True)
+
+    assert app_context.agent_manager.detect_agents.await_count == 2
+
+    # The forced result refreshes the cache
+    await app_context.detect_agents()
+    assert app_context.agent_manager.detect_agents.await_count == 2
@@ -0,0 +1,198 @@
+"""
+Tests for the health check.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+import pytest
+
+from src import health_check as health_check_module
+from src.health_check import HealthCheck
+
+
+@pytest.fixture
+def clock(fake_clock):
+    """Replace the clock used by the health check module."""
+    return fake_clock(health_check_module)
+
+
+@pytest.fixture
+def agent_api():
+    """Fake Agent API that counts /status requests."""
+    api = SimpleNamespace(requests=0, status_code=200)
+
+    def handler(request):
+        api.requests += 1
+        return httpx.Response(api.status_code, json={"status": "stable", "agentType": "goose"})
+
+    api.transport = httpx.MockTransport(handler)
+    return api
+
+
+@pytest.fixture
+async def health_check(agent_api):
+    """Create a health check talking to the fake Agent API."""
+    async with httpx.AsyncClient(transport=agent_api.transport) as http_client:
+        yield HealthCheck(SimpleNamespace(agent_api_url="http://agent"), http_client)
+
+
+async def test_check_health_cached_within_ttl(health_check, agent_api, clock):
+    """A healthy result is reused until its TTL expires."""
+    result = await health_check.check_health()
+    assert result["status"] == "healthy"
+    assert agent_api.requests == 1
+
+    clock.now += 26
+    await health_check.check_health()
+    assert agent_api.requests == 1
+
+    clock.now += 2
+    await health_check.check_health()
+    assert agent_api.requests == 2
+
+
+async def test_check_health_failure_uses_shorter_ttl(health_check, agent_api, clock):
+    """A failed result is reused for the shorter failure TTL."""
+    agent_api.status_code = 500
+    result = await health_check.check_health()
+    assert result["status"] == "unhealthy"
+    assert agent_api.requests == 1
+
+    clock.now += 8
+    await health_check.check_health()
+    assert agent_api.requests == 1
+
+    clock.now += 2
+    await health_check.check_health()
+    assert agent_api.requests == 2
+
+
+async def test_check_health_returns_copy(health_check, clock):
+    """Modifying a returned result doesn't corrupt the cached status."""
+    result = await health_check.check_health()
+    result["status"] = "modified"
+    result["agent"]["status"] = "modified"
+
+    cached = await health_check.check_health()
+    assert cached["status"] == "healthy"
+    assert cached["agent"]["status"] == "healthy"
+
+
+async def test_get_health_status(health_check, clock):
+    """get_health_status returns a read-only view of the current status."""
+    await health_check.check_health()
+
+    result = health_check.get_health_status()
+    assert dict(result) == health_check._health_status
+    with pytest.raises(TypeError):
+        result["status"] = "modified"
+    with pytest.raises(TypeError):
+        result["agent"]["status"] = "modified"
+
+
+async def test_get_health_status_dict(health_check, clock):
+    """get_health_status_dict returns plain, serializable dictionaries."""
+    await health_check.check_health()
+
+    result = health_check.get_health_status_dict()
+    assert result == health_check._health_status
+    json.dumps(result)
+
+    result["agent"]["status"] = "modified"
+    assert health_check._health_status["agent"]["status"] == "healthy"
+
+
+async def test_cancelled_check_does_not_break_client(clock):
+    """Cancelling a check mid-request leaves the HTTP client usable."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"status": "stable", "agentType": "goose"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        health_check = HealthCheck(SimpleNamespace(agent_api_url="http://agent"), http_client)
+
+        check = asyncio.create_task(health_check.check_health(force=True))
+        while not requests:
+            await asyncio.sleep(0.001)
+        check.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await check
+
+        # The shielded request keeps running and completes normally
+        in_flight = health_check._status_fetch
+        response = await in_flight
+        assert not in_flight.cancelled()
+        assert response.status_code == 200
+
+        # Subsequent checks issue new requests on the same client
+        clock.now += 2
+        result = await health_check.check_health(force=True)
+        assert len(requests) == 2
+        assert result["agent_api"]["status"] == "healthy"
+        assert result["agent"]["status"] == "healthy"
+
+
+async def test_check_resources_samples_process(monkeypatch):
+    """Resource usage comes from the psutil process handle without blocking."""
+    process = mock.MagicMock()
+    process.memory_info.return_value = SimpleNamespace(rss=123456)
+    process.cpu_percent.return_value = 12.5
+    fake_psutil = SimpleNamespace(Process=mock.MagicMock(return_value=process))
+    monkeypatch.setattr(health_check_module, "psutil", fake_psutil)
+
+    health_check = HealthCheck(SimpleNamespace(agent_api_url="http://agent"), mock.MagicMock())
+    status = await health_check._check_resources()
+
+    assert status["memory_usage"] == 123456
+    assert status["cpu_usage"] == 12.5
+    fake_psutil.Process.assert_called_once_with()
+    # Primed once when the health check is created, then sampled once
+    assert process.cpu_percent.call_args_list == [mock.call(interval=None)] * 2
+
+
+async def test_check_resources_without_psutil(monkeypatch):
+    """Resource usage is reported as 0 when psutil is not installed."""
+    monkeypatch.setattr(health_check_module, "psutil", None)
+
+    health_check = HealthCheck(SimpleNamespace(agent_api_url="http://agent"), mock.MagicMock())
+    status = await health_check._check_resources()
+
+    assert status["status"] == "healthy"
+    assert status["memory_usage"] == 0
+    assert status["cpu_usage"] == 0
+
+
+async def test_stop_wakes_idle_loop_and_start_restarts(health_check, agent_api, clock, caplog):
+    """stop() ends an idle loop without cancelling it, and start() runs checks again."""
+    loop = asyncio.get_running_loop()
+
+    async def wait_for_check(expires_at):
+        # A finished check moves the cache deadline forward
+        while health_check._cache_expires_at == expires_at:
+            await asyncio.sleep(0.001)
+
+    await health_check.start()
+    await asyncio.wait_for(wait_for_check(0.0), timeout=1.0)
+    assert agent_api.requests == 1
+
+    # The loop is now waiting out the 30 second interval
+    started = loop.time()
+    await health_check.stop()
+    assert loop.time() - started < 1.0
+    assert health_check._health_check_task is None
+    assert "Health check task cancelled" not in caplog.text
+
+    clock.now += 2
+    expires_at = health_check._cache_expires_at
+    await health_check.start()
+    await asyncio.wait_for(wait_for_check(expires_at), timeout=1.0)
+    assert agent_api.requests == 2
+
+    await health_check.stop()
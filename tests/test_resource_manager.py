@@ -0,0 +1,259 @@
+"""
+Tests for the resource manager.
+"""
+import asyncio
+import copy
+import pickle
+import subprocess
+import threading
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+
+from src.resource_manager import (
+    CustomResourceStatus,
+    ProcessStatus,
+    ResourceManager,
+    TaskStatus,
+)
+
+
+@pytest.fixture
+def resource_manager():
+    """Create a resource manager."""
+    return ResourceManager()
+
+
+def make_process(pid=12345, running=True):
+    """Create a mock subprocess.Popen."""
+    process = mock.MagicMock()
+    process.pid = pid
+    process.returncode = None if running else 0
+    process.poll.return_value = process.returncode
+    process.wait.return_value = 0
+    return process
+
+
+async def wait_until(condition, timeout=1.0):
+    """Yield to the event loop until condition() is true."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.parametrize("status", [
+    ProcessStatus(pid=12345, running=False, returncode=0),
+    TaskStatus(done=True, cancelled=False, exception="boom"),
+    CustomResourceStatus(type="list"),
+])
+def test_status_copy_and_pickle(status):
+    """Status entries can be converted, copied and pickled."""
+    assert asdict(status) == {name: getattr(status, name) for name in status.__slots__}
+    assert copy.copy(status) == status
+    assert copy.deepcopy(status) == status
+    assert pickle.loads(pickle.dumps(status)) == status
+
+
+async def test_track_process_cleans_up_when_cancelled(resource_manager):
+    """Cancelling the task inside track_process still stops the process."""
+    process = make_process()
+
+    async def use_process():
+        async with resource_manager.track_process("test_process", process):
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(use_process())
+    await wait_until(lambda: "test_process" in resource_manager._processes)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    process.terminate.assert_called_once()
+    assert resource_manager._processes == {}
+
+
+async def test_track_task_cleans_up_when_cancelled(resource_manager):
+    """Cancelling the task inside track_task still cancels the tracked task."""
+    tracked = asyncio.create_task(asyncio.sleep(10))
+
+    async def use_task():
+        async with resource_manager.track_task("test_task", tracked):
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(use_task())
+    await wait_until(lambda: "test_task" in resource_manager._tasks)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert tracked.cancelled()
+    assert resource_manager._tasks == {}
+
+
+async def test_track_process_cleanup_survives_repeated_cancel(resource_manager):
+    """Further cancel() calls during cleanup don't abandon the cleanup."""
+    process = make_process()
+    release = threading.Event()
+    process.wait.side_effect = lambda timeout=None: release.wait(1.0) and 0
+
+    async def use_process():
+        async with resource_manager.track_process("test_process", process):
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(use_process())
+    await wait_until(lambda: "test_process" in resource_manager._processes)
+    task.cancel()
+
+    # Cancel again, twice, while stop_process is waiting for the process to exit
+    await wait_until(lambda: process.wait.called)
+    for _ in range(2):
+        task.cancel()
+        await asyncio.sleep(0.01)
+        assert not task.done()
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    process.terminate.assert_called_once()
+    assert resource_manager._processes == {}
+
+
+async def test_stop_process(resource_manager):
+    """A process that exits after terminate() is not killed."""
+    process = make_process()
+    resource_manager.register_process("test_process", process)
+
+    await resource_manager.stop_process("test_process")
+
+    process.terminate.assert_called_once()
+    process.wait.assert_called_once_with(5.0)
+    process.kill.assert_not_called()
+    assert resource_manager._processes == {}
+
+
+async def test_stop_process_kills_after_timeout(resource_manager):
+    """A process that ignores terminate() is killed after the grace period."""
+    process = make_process()
+    process.wait.side_effect = [subprocess.TimeoutExpired("agent", 0.1), -9]
+    resource_manager.register_process("test_process", process)
+
+    await resource_manager.stop_process("test_process", timeout=0.1)
+
+    process.terminate.assert_called_once()
+    process.kill.assert_called_once()
+    assert process.wait.call_args_list == [mock.call(0.1), mock.call(2.0)]
+    assert resource_manager._processes == {}
+
+
+async def test_stop_process_already_exited(resource_manager):
+    """A process that already exited is not signalled, but its pipes are closed."""
+    process = make_process(running=False)
+    resource_manager.register_process("test_process", process)
+
+    await resource_manager.stop_process("test_process")
+
+    process.terminate.assert_not_called()
+    process.kill.assert_not_called()
+    process.stdout.close.assert_called_once()
+    process.stderr.close.assert_called_once()
+    process.stdin.close.assert_called_once()
+    assert resource_manager._processes == {}
+
+
+async def test_cleanup_all_runs_concurrently(resource_manager):
+    """Cleanups run concurrently, so the total time is close to the slowest one."""
+    async def slow_cleanup(resource):
+        await asyncio.sleep(0.01)
+
+    for i in range(100):
+        resource_manager.register_custom_resource(f"resource_{i}", i, slow_cleanup)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await resource_manager.cleanup_all()
+
+    # Run one after another, the cleanups would take at least 1s
+    assert loop.time() - start < 0.5
+    assert resource_manager._custom_resources == {}
+
+
+async def test_cleanup_all_continues_after_error(resource_manager, caplog):
+    """A failing cleanup is logged and doesn't stop the others."""
+    resource_manager.register_process("test_process", make_process())
+    tracked = asyncio.create_task(asyncio.sleep(10))
+    resource_manager.register_task("test_task", tracked)
+    cleanup_func = mock.MagicMock()
+    resource_manager.register_custom_resource("test_resource", object(), cleanup_func)
+
+    with mock.patch.object(
+        resource_manager, "stop_process", mock.AsyncMock(side_effect=RuntimeError("boom"))
+    ):
+        await resource_manager.cleanup_all()
+
+    assert tracked.cancelled()
+    cleanup_func.assert_called_once()
+    assert resource_manager._tasks == {}
+    assert resource_manager._custom_resources == {}
+    assert "Error stopping process 'test_process': boom" in caplog.text
+
+
+async def test_get_resource_status_task_finishes(resource_manager):
+    """A task's status is refreshed once the task finishes."""
+    release = asyncio.Event()
+    task = asyncio.create_task(release.wait())
+    resource_manager.register_task("test_task", task)
+
+    status = await resource_manager.get_resource_status()
+    assert status["tasks"]["test_task"] == TaskStatus(done=False, cancelled=False, exception=None)
+
+    release.set()
+    await task
+    await asyncio.sleep(0)  # let the done callback run
+
+    status = await resource_manager.get_resource_status()
+    assert status["tasks"]["test_task"] == TaskStatus(done=True, cancelled=False, exception=None)
+
+
+async def test_get_resource_status_process_exits(resource_manager):
+    """A running process is polled again until it exits."""
+    process = make_process()
+    resource_manager.register_process("test_process", process)
+
+    status = await resource_manager.get_resource_status()
+    assert status["processes"]["test_process"] == ProcessStatus(pid=12345, running=True, returncode=None)
+
+    process.returncode = 1
+    process.poll.return_value = 1
+
+    status = await resource_manager.get_resource_status()
+    assert status["processes"]["test_process"] == ProcessStatus(pid=12345, running=False, returncode=1)
+
+    # An exited process isn't polled again
+    poll_count = process.poll.call_count
+    await resource_manager.get_resource_status()
+    assert process.poll.call_count == poll_count
+
+
+async def test_get_resource_status_key_reused(resource_manager):
+    """Re-registering a key reports the new resource, not the cached status."""
+    resource_manager.register_process("test_process", make_process(pid=1))
+    resource_manager.register_custom_resource("test_resource", [], lambda resource: None)
+    await resource_manager.get_resource_status()
+
+    resource_manager.unregister_process("test_process")
+    resource_manager.unregister_custom_resource("test_resource")
+    status = await resource_manager.get_resource_status()
+    assert status["processes"] == {}
+    assert status["custom_resources"] == {}
+
+    resource_manager.register_process("test_process", make_process(pid=2, running=False))
+    resource_manager.register_custom_resource("test_resource", "text", lambda resource: None)
+    status = await resource_manager.get_resource_status()
+    assert status["processes"]["test_process"] == ProcessStatus(pid=2, running=False, returncode=0)
+    assert status["custom_resources"]["test_resource"] == CustomResourceStatus(type="str")
@@ -0,0 +1,201 @@
+"""
+Tests for the MCP server tools and resources.
+"""
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def server_module(real_modules):
+    """Import the real server module."""
+    from mcp_agentapi import server
+    return server
+
+
+@pytest.fixture
+def app_context(real_modules):
+    """Create a stand-in lifespan context for the server tools."""
+    from src.agent_manager import AgentInstallStatus
+    from src.models import AgentType
+
+    agents = {
+        AgentType.GOOSE: SimpleNamespace(install_status=AgentInstallStatus.INSTALLED),
+        AgentType.AIDER: SimpleNamespace(install_status=AgentInstallStatus.NOT_INSTALLED),
+    }
+    return SimpleNamespace(
+        agent_type_name="goose",
+        agent_api_url="http://agent",
+        agent_info_json=None,
+        openapi_schema_json=None,
+        detect_agents=mock.AsyncMock(return_value=agents),
+        health_check=SimpleNamespace(
+            check_health=mock.AsyncMock(return_value={"status": "healthy"})
+        ),
+        api_client=mock.MagicMock(),
+    )
+
+
+async def test_describe_agent_state(server_module, app_context, monkeypatch):
+    """describe_agent_state returns agents, agent type and health in one call."""
+    from mcp.shared.memory import create_connected_server_and_client_session
+
+    @asynccontextmanager
+    async def lifespan(server):
+        yield app_context
+
+    low_level_server = server_module.mcp._mcp_server
+    monkeypatch.setattr(low_level_server, "lifespan", lifespan)
+
+    async with create_connected_server_and_client_session(low_level_server) as client:
+        result = await client.call_tool("describe_agent_state", {})
+
+    assert not result.isError
+    state = json.loads(result.content[0].text)
+    assert state == {
+        "agents": [
+            {"type": "goose", "status": "installed"},
+            {"type": "aider", "status": "not_installed"},
+        ],
+        "agent_type": "goose",
+        "health": {"status": "healthy"},
+    }
+    app_context.detect_agents.assert_awaited_once()
+    app_context.health_check.check_health.assert_awaited_once()
+
+
+@pytest.fixture
+def tool_context(app_context):
+    """Create a stand-in MCP context for calling the tools directly."""
+    app_context.api_client.send_message = mock.AsyncMock(
+        side_effect=lambda content, message_type: {"ok": True, "content": content}
+    )
+    return SimpleNamespace(request_context=SimpleNamespace(lifespan_context=app_context))
+
+
+async def test_send_messages_batch(server_module, tool_context):
+    """All messages are sent in order."""
+    result = await server_module.send_messages_batch(tool_context, [
+        {"content": "hello"},
+        {"content": "\x03", "type": "raw"},
+    ])
+
+    assert result["sent"] == 2
+    assert [r["content"] for r in result["results"]] == ["hello", "\x03"]
+
+
+async def test_send_messages_batch_invalid_type(server_module, tool_context):
+    """An invalid type anywhere in the batch means nothing is sent."""
+    result = await server_module.send_messages_batch(tool_context, [
+        {"content": "first"},
+        {"content": "second", "type": "bogus"},
+        {"content": "third"},
+    ])
+
+    assert result["error_type"] == "ValidationError"
+    assert result["status_code"] == 400
+    assert "message 1" in result["error"]
+    tool_context.request_context.lifespan_context.api_client.send_message.assert_not_called()
+
+
+async def test_send_messages_batch_missing_content(server_module, tool_context):
+    """A message without content is rejected before anything is sent."""
+    result = await server_module.send_messages_batch(tool_context, [
+        {"content": "first"},
+        {"type": "user"},
+    ])
+
+    assert result["error_type"] == "ValidationError"
+    assert result["error"] == "Message 1 has no content"
+    tool_context.request_context.lifespan_context.api_client.send_message.assert_not_called()
+
+
+async def test_send_messages_batch_partial_failure(server_module, tool_context):
+    """A failed send reports how many messages were sent before it."""
+    send_message = tool_context.request_context.lifespan_context.api_client.send_message
+    send_message.side_effect = [{"ok": True}, RuntimeError("connection lost"), {"ok": True}]
+
+    result = await server_module.send_messages_batch(tool_context, [
+        {"content": "first"},
+        {"content": "second"},
+        {"content": "third"},
+    ])
+
+    assert result["error"] == "connection lost"
+    assert result["sent"] == 1
+    assert result["results"] == [{"ok": True}]
+    assert send_message.await_count == 2
+
+
+async def test_get_agent_info_cached_per_status(server_module, tool_context):
+    """The serialized info is reused until the agent status changes."""
+    api_client = tool_context.request_context.lifespan_context.api_client
+    api_client.get_status = mock.AsyncMock(return_value={"status": "stable"})
+
+    with mock.patch.object(server_module.mcp, "get_context", return_value=tool_context):
+        first = await server_module.get_agent_info()
+        second = await server_module.get_agent_info()
+
+        api_client.get_status.return_value = {"status": "running"}
+        third = await server_module.get_agent_info()
+
+    assert second is first
+    assert third is not first
+    assert json.loads(first) == {
+        "agent_type": "goose",
+        "agent_api_url": "http://agent",
+        "status": "stable",
+    }
+    assert json.loads(third)["status"] == "running"
+
+
+async def test_get_openapi_schema_cached_per_schema(server_module, tool_context):
+    """The serialized schema is reused until the schema changes, even without a version bump."""
+    schema = {"info": {"version": "1.0"}, "paths": {}}
+    api_client = tool_context.request_context.lifespan_context.api_client
+    api_client.get_openapi_schema = mock.AsyncMock(side_effect=lambda: dict(schema))
+
+    with mock.patch.object(server_module.mcp, "get_context", return_value=tool_context):
+        first = await server_module.get_openapi_schema()
+        second = await server_module.get_openapi_schema()
+
+        schema["paths"] = {"/status": {}}
+        third = await server_module.get_openapi_schema()
+
+    assert second is first
+    assert json.loads(third)["paths"] == {"/status": {}}
+
+
+async def test_get_openapi_schema_without_version(server_module, tool_context):
+    """Schemas without a version are serialized on every call."""
+    schema = {"paths": {}}
+    api_client = tool_context.request_context.lifespan_context.api_client
+    api_client.get_openapi_schema = mock.AsyncMock(side_effect=lambda: dict(schema))
+
+    with mock.patch.object(server_module.mcp, "get_context", return_value=tool_context):
+        await server_module.get_openapi_schema()
+        schema["paths"] = {"/status": {}}
+        result = await server_module.get_openapi_schema()
+
+    assert json.loads(result)["paths"] == {"/status": {}}
+    assert tool_context.request_context.lifespan_context.openapi_schema_json is None
+
+
+@pytest.mark.parametrize("agent_name, expected", [("Goose", "goose"), ("bogus", None)])
+async def test_main_agent_argument(server_module, monkeypatch, agent_name, expected):
+    """--agent is converted case-insensitively, and an invalid name is ignored."""
+    from src.config import Config
+
+    config = Config()
+    monkeypatch.setattr(server_module.sys, "argv", ["mcp-agentapi", "--agent", agent_name])
+    monkeypatch.setattr(server_module, "load_config", lambda: config)
+    monkeypatch.setattr(server_module, "save_config", mock.MagicMock(return_value=True))
+    monkeypatch.setattr(server_module.mcp, "run_stdio_async", mock.AsyncMock())
+
+    await server_module.main()
+
+    agent_type = config.agent_type
+    assert (agent_type.value if agent_type else None) == expected